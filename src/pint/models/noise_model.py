@@ -1,6 +1,7 @@
 """Pulsar timing noise models."""
 
 import copy
+import os
 from typing import Callable, List, Optional, Tuple
 import warnings
 
@@ -13,6 +14,9 @@ from pint.models.parameter import Parameter, floatParameter, intParameter, maskP
 from pint.models.timing_model import Component
 from pint.toa import TOAs
 
+# One cycle per year in Hz, the reference frequency of the power-law spectra
+_fyr = (1 / u.year).to_value(u.Hz)
+
 
 class NoiseComponent(Component):
 
@@ -45,10 +49,44 @@ class WhiteNoiseComponent(NoiseComponent):
 
 
 class CorrelatedNoiseComponent(NoiseComponent):
-    """Abstract base class for all correlated noise components."""
+    """Abstract base class for all correlated noise components.
+
+    Notes
+    -----
+    Fourier bases built with
+    :meth:`~pint.models.noise_model.CorrelatedNoiseComponent.fourier_design_matrix`
+    are cached and reused while the times and frequencies are unchanged, unless
+    ``$PINT_DISABLE_CACHE=1`` or ``$PINT_DISABLE_NOISE_BASIS_CACHE=1``
+    """
 
     is_time_correlated = False
 
+    def __init__(self):
+        super().__init__()
+        self.use_basis_cache = not (
+            os.environ.get("PINT_DISABLE_CACHE", None) == "1"
+            or os.environ.get("PINT_DISABLE_NOISE_BASIS_CACHE", None) == "1"
+        )
+        self._basis_cache_key = None
+        self._basis_cache = None
+
+    def fourier_design_matrix(self, t: np.ndarray, f: np.ndarray) -> np.ndarray:
+        """Return :func:`~pint.models.noise_model.create_fourier_design_matrix` for ``t`` and ``f``.
+
+        The basis only depends on the TOA times and the mode frequencies, not on
+        the noise amplitudes, so the last one computed is kept and a copy of it
+        is returned when it is requested again with the same inputs.
+        """
+        if not self.use_basis_cache:
+            return create_fourier_design_matrix(t, f)
+        t = np.asarray(t)
+        f = np.asarray(f)
+        key = (t.dtype, t.shape, t.tobytes(), f.dtype, f.shape, f.tobytes())
+        if key != self._basis_cache_key:
+            self._basis_cache = create_fourier_design_matrix(t, f)
+            self._basis_cache_key = key
+        return self._basis_cache.copy(order="K")
+
     def get_noise_basis(self, toas):
         raise NotImplementedError
 
@@ -618,7 +656,7 @@ class PLDMNoise(CorrelatedNoiseComponent):
         See the documentation for pl_dm_basis_weight_pair function for details."""
 
         t, f = self.get_time_frequencies(toas)
-        Fmat = create_fourier_design_matrix(t, f)
+        Fmat = self.fourier_design_matrix(t, f)
         freqs = self._parent.barycentric_radio_freq(toas).to(u.MHz)
         fref = 1400 * u.MHz
         D = (fref.value / freqs.value) ** 2
@@ -781,7 +819,7 @@ class PLSWNoise(CorrelatedNoiseComponent):
         freqs = self._parent.barycentric_radio_freq(toas).to(u.MHz)
         # get the achromatic Fourier design matrix
         t, f = self.get_time_frequencies(toas)
-        Fmat = create_fourier_design_matrix(t, f)
+        Fmat = self.fourier_design_matrix(t, f)
         # get solar wind geometry from pint.models.solar_wind_dispersion.SolarWindDispersion
         solar_wind_geometry = self._parent.solar_wind_geometry(toas)
         # since this is the SW DM value if n_earth = 1 cm^-3. the GP will scale it.
@@ -962,7 +1000,7 @@ class PLChromNoise(CorrelatedNoiseComponent):
         See the documentation for pl_chrom_basis_weight_pair function for details."""
 
         t, f = self.get_time_frequencies(toas)
-        Fmat = create_fourier_design_matrix(t, f)
+        Fmat = self.fourier_design_matrix(t, f)
         freqs = self._parent.barycentric_radio_freq(toas).to(u.MHz)
         fref = 1400 * u.MHz
         alpha = self._parent.TNCHROMIDX.value
@@ -1161,7 +1199,7 @@ class PLRedNoise(CorrelatedNoiseComponent):
         See the documentation for pl_rn_basis_weight_pair function for details."""
 
         t, f = self.get_time_frequencies(toas)
-        Fmat = create_fourier_design_matrix(t, f)
+        Fmat = self.fourier_design_matrix(t, f)
 
         return Fmat
 
@@ -1285,7 +1323,7 @@ def get_rednoise_freqs(
         Return an array of n_lin linearly spaced frequencies:
             [1/T, 2/T, ..., n_lin/T].
         """
-        return np.arange(1, n_lin + 1) / T
+        return np.arange(1, n_lin + 1, dtype=np.float64) / T
 
     def _get_loglin_freqs(logmode_, f_min_, n_log, n_lin, T):
         """
@@ -1333,7 +1371,9 @@ def get_rednoise_freqs(
         # Log + linear: nlog log-freqs + nmodes linear-freqs
         freqs = _get_loglin_freqs(logmode, f_min, nlog, nmodes, Tspan)
 
-    return freqs
+    # The time span usually comes from long double TOAs, but the frequencies
+    # need no more than float64, which keeps the basis and weights in float64
+    return freqs.astype(np.float64, copy=False)
 
 
 def create_fourier_design_matrix(t, f) -> np.ndarray:
@@ -1351,18 +1391,23 @@ def create_fourier_design_matrix(t, f) -> np.ndarray:
         freqs : ndarray
             The same frequencies array `f` is returned for convenience.
     """
-    t = np.asarray(t)
-    f = np.asarray(f)
+    # TOAs usually arrive as long doubles; float64 is plenty for the
+    # basis and keeps sin/cos on the fast vectorized path
+    t = np.asarray(t, dtype=np.float64)
+    f = np.asarray(f, dtype=np.float64)
 
     N = len(t)
     nfreqs = len(f)
 
-    # Initialize design matrix
-    F = np.zeros((N, 2 * nfreqs))
+    # Initialize design matrix; column-major, so each basis vector is
+    # contiguous for the products with the TOAs that follow
+    F = np.empty((N, 2 * nfreqs), order="F")
 
-    # Fill sine (even columns) and cosine (odd columns)
-    F[:, 0::2] = np.sin(2.0 * np.pi * t[:, None] * f)
-    F[:, 1::2] = np.cos(2.0 * np.pi * t[:, None] * f)
+    # Fill sine (even columns) and cosine (odd columns) from a single
+    # phase array, laid out to match the columns of F
+    phase = np.multiply.outer(2.0 * np.pi * f, t).T
+    np.sin(phase, out=F[:, 0::2])
+    np.cos(phase, out=F[:, 1::2])
 
     return F
 
@@ -1378,8 +1423,9 @@ def powerlaw(
     :param f_low_cut: Minimum frequency to include [Hz]
     :return: Power spectral density
     """
-    f_low_cut = f_low_cut if f_low_cut is not None else np.min(f)
-    above_fl = np.array(f >= f_low_cut, dtype=float)
-
-    fyr = (1 / u.year).to_value(u.Hz)
-    return A**2 / 12.0 / np.pi**2 * fyr ** (gamma - 3) * f ** (-gamma) * above_fl
+    f = np.asarray(f, dtype=np.float64)
+    psd = A**2 / 12.0 / np.pi**2 * _fyr ** (gamma - 3) * f ** (-gamma)
+    if f_low_cut is None:
+        # The default cutoff is the lowest frequency, so nothing is removed
+        return psd
+    return np.where(f >= f_low_cut, psd, 0.0)
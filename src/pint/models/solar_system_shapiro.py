@@ -18,6 +18,9 @@ from pint import (
 from pint.models.parameter import boolParameter
 from pint.models.timing_model import DelayComponent
 
+# log of 1 AU in km, the unit of the position columns in the TOA table
+_LOG_AU_KM = np.log(const.au.to_value(u.km))
+
 
 class SolarSystemShapiro(DelayComponent):
     """Shapiro delay due to light bending near Solar System objects.
@@ -54,6 +57,12 @@ class SolarSystemShapiro(DelayComponent):
         "uranus": Turanus.value,
         "neptune": Tneptune.value,
     }
+    # Planets included when PLANET_SHAPIRO is set
+    _planets = ("jupiter", "saturn", "venus", "uranus", "neptune")
+    # ... and the TOA table columns holding their positions
+    _planet_cols = tuple(f"obs_{pl}_pos" for pl in _planets)
+    # Masses of the Sun followed by _planets, as an array
+    _body_T = np.array([_ss_mass_sec["sun"], *map(_ss_mass_sec.get, _planets)])
 
     @staticmethod
     def ss_obj_shapiro_delay(obj_pos, psr_dir, T_obj):
@@ -63,13 +72,17 @@ class SolarSystemShapiro(DelayComponent):
         returns Shapiro delay in seconds for a solar system object.
 
         Inputs:
-          obj_pos : position vector from Earth to SS object, with Units
-          psr_dir : unit vector in direction of pulsar
-          T_obj : mass of object in seconds (GM/c^3)
+          obj_pos : (..., N, 3) array of position vectors from Earth to SS
+            object(s), in km
+          psr_dir : (N, 3) or (3,) array of unit vectors in direction of pulsar
+          T_obj : mass of object(s) in seconds (GM/c^3), broadcastable
+            against obj_pos[..., 0]
         """
-        # TODO: np.sum currently loses units in some cases...
-        r = (np.sqrt(np.sum(obj_pos**2, axis=1))) * obj_pos.unit
-        rcostheta = np.sum(obj_pos * psr_dir, axis=1)
+        # einsum sums the squares without an obj_pos**2 temporary
+        r = np.einsum("...j,...j->...", obj_pos, obj_pos)
+        np.sqrt(r, out=r)
+        # Row-wise dot product; avoids the (N, 3) temporary of obj_pos * psr_dir
+        rcostheta = np.einsum("...j,...j->...", obj_pos, psr_dir)
         # This is the 2nd to last term from Eqn 4.6 in Backer &
         # Hellings, ARAA, 1986 with gamma = 1 (as defined by GR).  We
         # have the opposite sign of the cos(theta) term, since our
@@ -78,7 +91,13 @@ class SolarSystemShapiro(DelayComponent):
         # pulsar (as described after Eqn 4.3 in the paper).
         # See also https://en.wikipedia.org/wiki/Shapiro_time_delay
         # where \Delta t = \frac{2GM}{c^3}\log(1-\vec{R}\cdot\vec{x})
-        return -2.0 * T_obj * np.log((r - rcostheta) / const.au).value
+        # Evaluated in place in r to avoid full-length temporaries, with
+        # log((r - rcostheta) / AU) written as log(r - rcostheta) - log(AU)
+        delay = np.subtract(r, rcostheta, out=r)
+        np.log(delay, out=delay)
+        delay -= _LOG_AU_KM
+        delay *= -2.0 * T_obj
+        return delay
 
     def solar_system_shapiro_delay(self, toas, acc_delay=None):
         """
@@ -99,26 +118,42 @@ class SolarSystemShapiro(DelayComponent):
         delay = np.zeros(len(toas))
 
         if np.any(non_bary_mask):
-            tbl_grp = toas.table if np.all(non_bary_mask) else toas.table[non_bary_mask]
-
-            psr_dir = self._parent.ssb_to_psb_xyz_ICRS(
-                epoch=tbl_grp["tdbld"].astype(np.float64)
-            )
-            delay[non_bary_mask] += self.ss_obj_shapiro_delay(
-                tbl_grp["obs_sun_pos"], psr_dir, self._ss_mass_sec["sun"]
+            # Only pull out the columns we need rather than copying the whole
+            # table when some TOAs are barycentered.
+            rows = slice(None) if np.all(non_bary_mask) else non_bary_mask
+
+            # ssb_to_psb_xyz_ICRS may hand back a transposed (strided) view;
+            # make it a contiguous array once so every body's einsum is fast.
+            psr_dir = np.ascontiguousarray(
+                self._parent.ssb_to_psb_xyz_ICRS(
+                    epoch=toas.table["tdbld"][rows].astype(np.float64)
+                ).value,
+                dtype=np.float64,
             )
+            sun_pos = toas.table["obs_sun_pos"].quantity[rows].to_value(u.km)
             if self.PLANET_SHAPIRO.value:
                 try:
-                    for pl in ("jupiter", "saturn", "venus", "uranus", "neptune"):
-                        delay[non_bary_mask] += self.ss_obj_shapiro_delay(
-                            tbl_grp[f"obs_{pl}_pos"],
-                            psr_dir,
-                            self._ss_mass_sec[pl],
-                        )
+                    # Stack all bodies into one (K, N, 3) array so the delays
+                    # of all of them are evaluated in a single pass.
+                    obj_pos = np.stack(
+                        [sun_pos]
+                        + [
+                            toas.table[col].quantity[rows].to_value(u.km)
+                            for col in self._planet_cols
+                        ]
+                    )
                 except KeyError as e:
                     raise KeyError(
                         "Planet positions not found when trying to compute Solar System Shapiro delay. "
                         "Make sure that you include `planets=True` in your `get_TOAs()` call, or use `get_model_and_toas()`."
                     ) from e
+                delay[rows] = self.ss_obj_shapiro_delay(
+                    obj_pos, psr_dir, self._body_T[:, np.newaxis]
+                ).sum(axis=0)
+            else:
+                # Sun only: no need to copy the positions into a stacked array
+                delay[rows] = self.ss_obj_shapiro_delay(
+                    sun_pos, psr_dir, self._ss_mass_sec["sun"]
+                )
 
         return delay * u.second
@@ -285,6 +285,15 @@ class Observatory:
     def aliases(self):
         return self._aliases
 
+    @classmethod
+    def _get_registered(cls, name):
+        """Look up a lower-case name or alias in the registry, returning None if absent."""
+        if name in cls._registry:
+            return cls._registry[name]
+        elif name in cls._alias_map:
+            return cls._registry[cls._alias_map[name]]
+        return None
+
     @classmethod
     def get(cls, name, apply_gps2utc=None, overwrite=False):
         """Returns the Observatory instance for the specified name/alias.
@@ -294,12 +303,6 @@ class Observatory:
         only way Observatory objects should be accessed.  Name-matching
         is case-insensitive.
         """
-        # Ensure that the observatory list has been read
-        # We can't do this in the import section above because this class
-        # needs to exist before that file is imported.
-        import pint.observatory.topo_obs  # noqa
-        import pint.observatory.special_locations  # noqa
-
         if name == "":
             raise KeyError("No observatory name or code provided")
 
@@ -307,12 +310,15 @@ class Observatory:
         name = name.lower()
 
         # First see if name matches an already-registered observatory (or an alias)
-        if name in cls._registry:
-            site = cls._registry[name]
-        elif name in cls._alias_map:
-            site = cls._registry[cls._alias_map[name]]
-        else:
-            site = None
+        site = cls._get_registered(name)
+        if site is None:
+            # Ensure that the observatory list has been read
+            # We can't do this in the import section above because this class
+            # needs to exist before that file is imported.
+            import pint.observatory.topo_obs  # noqa
+            import pint.observatory.special_locations  # noqa
+
+            site = cls._get_registered(name)
         if site is not None:
             if overwrite and apply_gps2utc is not None:
                 # This will modify the Observatory object in the registry, so it will "stick" until overwritten
@@ -32,18 +32,18 @@ class ClockFile:
     ClockFile.read() method, for example:
 
         >>> cf = ClockFile.read(os.getenv('TEMPO')+'/clock/time_gbt.dat')
-        >>> print cf.time
+        >>> print(cf.time)
         [ 51909.5  51910.5  51911.5 ...,  57475.5  57476.5  57477.5]
-        >>> print cf.clock
+        >>> print(cf.clock)
         [-3.14  -3.139 -3.152 ...,  0.179  0.185  0.188] us
 
     Or:
 
         >>> cf = ClockFile.read(os.getenv('TEMPO2')+'/clock/gbt2gps.clk',
                                     format='tempo2')
-        >>> print cf.time
+        >>> print(cf.time)
         [ 51909.5  51910.5  51911.5 ...,  57411.5  57412.5  57413.5]
-        >>> print cf.clock
+        >>> print(cf.clock)
         [ -3.14000000e-06  -3.13900000e-06  -3.15200000e-06 ...,   1.80000000e-08
            2.10000000e-08   2.30000000e-08] s
 
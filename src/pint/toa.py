@@ -23,7 +23,17 @@ import re
 import warnings
 from collections.abc import MutableMapping
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generator, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import astropy.table as table
 import astropy.time as time
@@ -94,6 +104,9 @@ toa_commands = (
     "END",
 )
 
+# Observatory codes that can start a Princeton-format TOA line
+_princeton_codes = frozenset("0123456789abcdefghijklmnopqrstuvwxyz@")
+
 all_planets = ("jupiter", "saturn", "venus", "uranus", "neptune", "earth")
 
 tempo_aliases = {
@@ -398,8 +411,9 @@ def save_pickle(toas: "TOAs", picklefilename: Optional[str] = None) -> None:
             picklefilename = f"{toas.filename[0]}.pickle.gz"
     else:
         raise ValueError("TOA pickle method needs a (single) filename.")
-    with gzip.open(picklefilename, "wb") as f:
-        pickle.dump(toas, f)
+    # Fast compression costs only a few percent in size on the TOA tables
+    with gzip.open(picklefilename, "wb", compresslevel=1) as f:
+        pickle.dump(toas, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def get_TOAs_list(
@@ -445,24 +459,24 @@ def _toa_format(line: str, fmt: str = "Unknown") -> str:
     Identifies a TOA line as one of the following types:
     Comment, Command, Blank, Tempo2, Princeton, ITOA, Parkes, Unknown.
     """
-    if re.match(r"[0-9a-z@] ", line):
+    # This is called on every line, so use plain character tests, not regexes
+    if line[1:2] == " " and line[0] in _princeton_codes:
         return "Princeton"
-    elif (
-        line.startswith("C ")
-        or line.startswith("c ")  # FIXME: This matches the re above!
-        or line.startswith("#")
-        or line.startswith("CC ")
-    ):
+    elif line.startswith(("C ", "c ", "#", "CC ")):  # FIXME: "c " is Princeton above!
         return "Comment"
     elif line.upper().lstrip().startswith(toa_commands):
         return "Command"
-    elif re.match(r"^\s*$", line):  # FIXME: what about empty lines?
+    elif not line or line.isspace():  # FIXME: what about empty lines?
         return "Blank"
-    elif re.match(r"^ ", line) and len(line) > 41 and line[41] == ".":
+    elif line.startswith(" ") and len(line) > 41 and line[41] == ".":
         return "Parkes"
     elif len(line) > 80 or fmt == "Tempo2":
         return "Tempo2"
-    elif re.match(r"\S\S", line) and len(line) > 14 and line[14] == ".":
+    elif (
+        len(line) > 14
+        and line[14] == "."
+        and not (line[0].isspace() or line[1].isspace())
+    ):
         # FIXME: This needs to be better
         return "ITOA"
     else:
@@ -729,11 +743,36 @@ def read_toa_file(
         is a file-like object, the directory is assumed to be the
         current directory.
     """
+    records, commands = _read_toa_records(
+        filename, process_includes=process_includes, cdict=cdict, dir=dir
+    )
+    toas = [
+        TOA(MJD, error=error, obs=obs, freq=freq, flags=flags)
+        for MJD, error, obs, freq, flags in records
+    ]
+    return toas, commands
+
+
+def _read_toa_records(
+    filename: file_like,
+    process_includes: bool = True,
+    cdict: Optional[dict] = None,
+    dir: Optional[dir_like] = None,
+) -> Tuple[list, list]:
+    """Read the TOA lines of a file without constructing :class:`pint.toa.TOA` objects.
+
+    This does the work of :func:`pint.toa.read_toa_file`, but each TOA is
+    returned as an ``(MJD, error, obs, freq, flags)`` tuple, where ``MJD``
+    is an (int, float) pair, ``error`` is in microseconds with EFAC/EQUAD
+    applied, ``freq`` is in MHz and ``flags`` is a :class:`pint.toa.FlagDict`.
+    This allows :func:`pint.toa._build_table_from_records` to construct the
+    times for each observatory at once.
+    """
     if isinstance(filename, (str, Path)):
         if dir is None:
             dir = Path(filename).parent
         with open(filename, "r") as f:
-            return read_toa_file(
+            return _read_toa_records(
                 f, process_includes=process_includes, cdict=cdict, dir=dir
             )
     else:
@@ -746,12 +785,14 @@ def read_toa_file(
     commands = []
     if cdict is None:
         cdict = {
+            # Uncertainties are in us and frequencies in MHz; plain floats
+            # keep the per-TOA checks below cheap
             "EFAC": 1.0,
-            "EQUAD": 0.0 * u.us,
-            "EMIN": 0.0 * u.us,
-            "EMAX": np.inf * u.us,
-            "FMIN": 0.0 * u.MHz,
-            "FMAX": np.inf * u.MHz,
+            "EQUAD": 0.0,
+            "EMIN": 0.0,
+            "EMAX": np.inf,
+            "FMIN": 0.0,
+            "FMAX": np.inf,
             "INFO": None,
             "SKIP": False,
             "TIME": 0.0,
@@ -766,7 +807,7 @@ def read_toa_file(
         top = True
     else:
         top = False
-    for line in f.readlines():
+    for line in f:
         MJD, d = _parse_TOA_line(line, fmt=cdict["FORMAT"])
         if d["format"] == "Command":
             cmd = d["Command"][0].upper()
@@ -782,10 +823,8 @@ def read_toa_file(
                 break
             elif cmd in ("TIME", "PHASE"):
                 cdict[cmd] += float(d["Command"][1])
-            elif cmd in ("EMIN", "EMAX", "EQUAD"):
-                cdict[cmd] = float(d["Command"][1]) * u.us
-            elif cmd in ("FMIN", "FMAX", "EQUAD"):
-                cdict[cmd] = float(d["Command"][1]) * u.MHz
+            elif cmd in ("EMIN", "EMAX", "EQUAD", "FMIN", "FMAX"):
+                cdict[cmd] = float(d["Command"][1])
             elif cmd in ("EFAC", "PHA1", "PHA2"):
                 cdict[cmd] = float(d["Command"][1])
                 if cmd in ("PHA1", "PHA2"):
@@ -810,7 +849,9 @@ def read_toa_file(
                 d["Command"][1] = str(include_filename)
                 # Make filename relative to directory the parent file is in
                 log.info(f"Processing included TOA file {include_filename}")
-                new_toas, new_commands = read_toa_file(include_filename, cdict=cdict)
+                new_toas, new_commands = _read_toa_records(
+                    include_filename, cdict=cdict
+                )
                 toas.extend(new_toas)
                 commands.extend(new_commands)
                 # re-set FORMAT
@@ -832,26 +873,31 @@ def read_toa_file(
             if top:
                 break
         else:
-            newtoa = TOA(MJD, **d)
+            error = d.pop("error")
+            obs = d.pop("obs")
+            freq = d.pop("freq")
+            if freq == 0.0:
+                freq = np.inf
             if (
-                (cdict["EMIN"] > newtoa.error)
-                or (cdict["EMAX"] < newtoa.error)
-                or (cdict["FMIN"] > newtoa.freq)
-                or (cdict["FMAX"] < newtoa.freq)
+                (cdict["EMIN"] > error)
+                or (cdict["EMAX"] < error)
+                or (cdict["FMIN"] > freq)
+                or (cdict["FMAX"] < freq)
             ):
                 continue
-            newtoa.error *= cdict["EFAC"]
-            newtoa.error = np.hypot(newtoa.error, cdict["EQUAD"])
+            error *= cdict["EFAC"]
+            error = np.hypot(error, cdict["EQUAD"])
+            flags = FlagDict.from_dict(d)
             if cdict["INFO"]:
-                newtoa.flags["info"] = cdict["INFO"]
+                flags["info"] = cdict["INFO"]
             if cdict["JUMP"][0]:
-                newtoa.flags["jump"] = str(cdict["JUMP"][1] + 1)
-                newtoa.flags["tim_jump"] = str(cdict["JUMP"][1] + 1)
+                flags["jump"] = str(cdict["JUMP"][1] + 1)
+                flags["tim_jump"] = str(cdict["JUMP"][1] + 1)
             if cdict["PHASE"] != 0:
-                newtoa.flags["phase"] = str(cdict["PHASE"])
+                flags["phase"] = str(cdict["PHASE"])
             if cdict["TIME"] != 0.0:
-                newtoa.flags["to"] = str(cdict["TIME"])
-            toas.append(newtoa)
+                flags["to"] = str(cdict["TIME"])
+            toas.append((MJD, error, obs, freq, flags))
             ntoas += 1
 
     return toas, commands
@@ -871,6 +917,62 @@ def build_table(toas: "TOAs", filename: Optional[str] = None) -> table.Table:
             for t in toas
         ]
     )
+    return _make_table(
+        table.Column(mjds), mjd_floats, errors, freqs, obss, flags, filename=filename
+    )
+
+
+def _build_table_from_records(
+    records: list, filename: Optional[str] = None
+) -> table.Table:
+    """Build the TOA table from the output of :func:`pint.toa._read_toa_records`.
+
+    This gives the same table as constructing a :class:`pint.toa.TOA` from
+    each record and calling :func:`pint.toa.build_table`, but the times for
+    each observatory are constructed as a single vector.
+    """
+    MJDs, errors, obss, freqs, flags = zip(*records)
+    mjds = np.empty(len(records), dtype=object)
+    mjd_floats = np.empty(len(records), dtype=float)
+    groups = {}
+    for i, obs in enumerate(obss):
+        groups.setdefault(obs, []).append(i)
+    for obs, grp in groups.items():
+        site = get_observatory(obs)
+        scale = site.timescale
+        # Note that when scale is UTC, must use pulsar_mjd format!
+        fmt = "pulsar_mjd" if scale.lower() == "utc" else "mjd"
+        t = time.Time(
+            np.array([MJDs[i][0] for i in grp]),
+            np.array([MJDs[i][1] for i in grp]),
+            scale=scale,
+            format=fmt,
+            precision=9,
+        )
+        try:
+            loc = site.earth_location_itrf(time=t)
+        except Exception:
+            # Just add information and re-raise
+            log.error(f"Error computing earth_location_itrf at times {t}")
+            raise
+        t = time.Time(t, location=loc, precision=9)
+        for i, ti in zip(grp, t):
+            mjds[i] = ti
+        mjd_floats[grp] = t.mjd
+    return _make_table(
+        table.Column(mjds), mjd_floats, errors, freqs, obss, flags, filename=filename
+    )
+
+
+def _make_table(
+    mjds: table.Column,
+    mjd_floats: Iterable[float],
+    errors: Iterable[float],
+    freqs: Iterable[float],
+    obss: Iterable[str],
+    flags: Iterable["FlagDict"],
+    filename: Optional[str] = None,
+) -> table.Table:
     # np.array guesses the shape wrong for object arrays
     flags_array = np.empty(len(mjds), dtype=object)
     for i, f in enumerate(flags):
@@ -878,7 +980,7 @@ def build_table(toas: "TOAs", filename: Optional[str] = None) -> table.Table:
     return table.Table(
         [
             np.arange(len(mjds)),
-            table.Column(mjds),
+            mjds,
             np.array(mjd_floats, dtype=float) * u.d,
             np.array(errors, dtype=float) * u.us,
             np.array(freqs, dtype=float) * u.MHz,
@@ -930,6 +1032,37 @@ def _cluster_by_gaps(t: np.ndarray, gap: float) -> np.ndarray:
     return clusters
 
 
+def _time_from_column(mjds: table.Column, location=None) -> time.Time:
+    """Build a single vector Time from a column of scalar Time objects.
+
+    Initializing a Time directly from the column goes through astropy's
+    generic per-object conversion; collecting ``jd1`` and ``jd2`` is much
+    cheaper. All entries must share the same time scale, as is the case
+    within an observatory group.
+
+    Parameters
+    ----------
+    mjds : astropy.table.Column
+        Column (or array) of scalar :class:`astropy.time.Time` objects
+    location : astropy.coordinates.EarthLocation, optional
+        Location to attach to the result
+
+    Returns
+    -------
+    astropy.time.Time
+    """
+    t0 = mjds[0]
+    t = time.Time(
+        np.array([t.jd1 for t in mjds]),
+        np.array([t.jd2 for t in mjds]),
+        format="jd",
+        scale=t0.scale,
+        location=location,
+    )
+    t.format = t0.format
+    return t
+
+
 class FlagDict(MutableMapping):
     def __init__(self, *args, **kwargs):
         self.store = {}
@@ -1063,7 +1196,7 @@ class TOA:
 
         >>> a = TOA((54567, 0.876876876876876), 4.5, freq=1400.0,
         ...         obs="GBT", backend="GUPPI")
-        >>> print a
+        >>> print(a)
         54567.876876876876876:  4.500 us error from 'GBT' at 1400.0000 MHz {'backend': 'GUPPI'}
 
     """
@@ -1353,18 +1486,16 @@ class TOAs:
         if (toatable is not None) and (toafile is not None):
             raise ValueError("Cannot initialize TOAs from both file and table.")
 
-        if toatable is None:
+        if toatable is None and toafile is not None:
+            records, self.commands = _read_toa_records(toafile)
             if isinstance(toafile, (str, Path)):
-                toalist, self.commands = read_toa_file(toafile)
                 # Check to see if there were any INCLUDEs:
                 inc_fns = [
                     x[0][1] for x in self.commands if x[0][0].upper() == "INCLUDE"
                 ]
                 self.filename = [toafile] + inc_fns if inc_fns else toafile
-            elif toafile is not None:
-                toalist, self.commands = read_toa_file(toafile)
-                self.filename = None
-
+            self.table = _build_table_from_records(records, filename=self.filename)
+        elif toatable is None:
             if toalist is None:
                 raise ValueError("No TOAs found!")
             if not isinstance(toalist, (list, tuple)):
@@ -2236,20 +2367,37 @@ class TOAs:
         corrections = np.zeros(self.ntoas) * u.s
         # values of "-to" flags
         time_statements = self.get_flag_value("to", 0, float)[0] * u.s
+        mjd_col = self.table["mjd"]
         for obs, grp in self.get_obs_groups():
             site = get_observatory(obs)
+            mjds = mjd_col[grp]
+            topo = isinstance(site, TopoObs)
+            # For TopoObs, it is safe to assume that all TOAs have same location
+            grpmjds = _time_from_column(
+                mjds, location=mjds[0].location if topo else None
+            )
             clock_corrections = site.clock_corrections(
-                time.Time(self["mjd"][grp]),
+                grpmjds,
                 include_bipm=include_bipm,
                 bipm_version=bipm_version,
                 limits=limits,
             )
             corrections[grp] = time_statements[grp] + clock_corrections
-            for jj in grp:
-                self["mjd"][jj] += time.TimeDelta(corrections[jj])
-
-                if corrections[jj] != 0:
-                    flags[jj]["clkcorr"] = str(corrections[jj].to_value(u.s))
+            # Work in float seconds to avoid a Quantity per TOA below
+            grpcorr = corrections[grp].to_value(u.s)
+            if topo:
+                # Correct the whole group at once and write back the elements
+                grpmjds += time.TimeDelta(grpcorr, format="sec")
+                grpmjds.precision = mjds[0].precision
+                for jj, t in zip(grp, grpmjds):
+                    mjd_col[jj] = t
+            else:
+                # Other sites may carry a separate location for each TOA
+                for jj, c in zip(grp, grpcorr):
+                    mjd_col[jj] += time.TimeDelta(c, format="sec")
+            for jj, c in zip(grp, grpcorr):
+                if c != 0:
+                    flags[jj]["clkcorr"] = str(c)
             self["mjd_float"][grp] += corrections[grp].to_value(u.d)
         # Update clock correction info
         self.clock_corr_info.update(
@@ -2302,33 +2450,35 @@ class TOAs:
         log.debug(f"Using EPHEM = {self.ephem} for TDB calculation.")
         # Compute in observatory groups
         tdbs = np.zeros_like(self.table["mjd"])
+        tdblds = np.zeros(self.ntoas, dtype=np.longdouble)
         for obs, grp in self.get_obs_groups():
             site = get_observatory(obs)
+            # Index the column rather than the table to avoid copying every column
+            mjds = self.table["mjd"][grp]
             if isinstance(site, TopoObs):
                 # For TopoObs, it is safe to assume that all TOAs have same location
-                # I think we should report to astropy that initializing
-                # a Time from a list (or Column) of Times throws away the location information
-                grpmjds = time.Time(
-                    self.table[grp]["mjd"], location=self.table[grp]["mjd"][0].location
-                )
+                grpmjds = _time_from_column(mjds, location=mjds[0].location)
             elif isinstance(site, SatelliteObs):
                 # for satellites, the location does not matter
-                grpmjds = time.Time(self.table[grp]["mjd"], location=None)
+                grpmjds = _time_from_column(mjds)
             else:
                 # Grab locations for each TOA
-                loclist = np.array([t.location for t in self.table[grp]["mjd"]])
+                loclist = np.array([t.location for t in mjds])
                 if loclist[0] is None:
-                    grpmjds = time.Time(self.table[grp]["mjd"], location=None)
+                    grpmjds = _time_from_column(mjds)
                 else:
                     locs = EarthLocation(
                         x=loclist["x"] * u.m, y=loclist["y"] * u.m, z=loclist["z"] * u.m
                     )
-                    grpmjds = time.Time(self.table[grp]["mjd"], location=locs)
+                    grpmjds = _time_from_column(mjds, location=locs)
 
-            tdbs[grp] = site.get_TDBs(grpmjds, method=method, ephem=ephem)
+            grptdbs = site.get_TDBs(grpmjds, method=method, ephem=ephem)
+            tdbs[grp] = grptdbs
+            # Convert the whole group at once rather than each scalar Time
+            tdblds[grp] = grptdbs.tdb.mjd_long
         # Now add the new columns to the table
         col_tdb = table.Column(name="tdb", data=tdbs)
-        col_tdbld = table.Column(name="tdbld", data=[t.tdb.mjd_long for t in tdbs])
+        col_tdbld = table.Column(name="tdbld", data=tdblds)
         self.table.add_columns([col_tdb, col_tdbld])
 
     def compute_posvels(
@@ -2660,8 +2660,11 @@ def group_iterator(items: np.ndarray) -> Iterator[Tuple]:
         >>>     print(f"{o} {i}")
 
     """
-    for item in np.unique(items):
-        yield item, np.where(items == item)[0]
+    # Sort once and split, rather than searching the whole array for each item
+    unique, inverse = np.unique(np.asarray(items), return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse, minlength=len(unique)))[:-1]
+    yield from zip(unique, np.split(order, bounds))
 
 
 def compute_hash(filename: file_like) -> bytes:
@@ -6,7 +6,12 @@ import pytest
 from pint.config import examplefile
 from pint.models import get_model_and_toas, get_model
 from pint.models.timing_model import Component
-from pint.models.noise_model import NoiseComponent
+from pint.models.noise_model import (
+    NoiseComponent,
+    create_fourier_design_matrix,
+    get_rednoise_freqs,
+    powerlaw,
+)
 from pint.simulation import make_fake_toas_uniform
 from io import StringIO
 
@@ -179,3 +184,35 @@ def test_white_noise_model_derivs():
     assert np.isclose(
         dq2[-1], sigma[-1] * m.EQUAD2.quantity * (m.EFAC2.quantity / sigma[-1]) ** 2
     )
+
+
+def test_fourier_basis_and_powerlaw_longdouble_input():
+    t = np.linspace(4.5e9, 4.8e9, 50, dtype=np.longdouble)
+    f = get_rednoise_freqs(t, 10)
+    assert f.dtype == np.float64
+    F = create_fourier_design_matrix(t, f)
+    assert F.dtype == np.float64
+    assert F.shape == (50, 20)
+    phase = 2 * np.pi * np.outer(t, f)
+    assert np.allclose(F[:, 0::2], np.sin(phase))
+    assert np.allclose(F[:, 1::2], np.cos(phase))
+
+    psd = powerlaw(f, A=1e-14, gamma=4.33)
+    assert psd.dtype == np.float64
+    assert np.all(np.diff(psd) < 0)
+
+
+def test_fourier_design_matrix_cache():
+    component = Component.component_types["PLRedNoise"]()
+    t = np.linspace(4.5e9, 4.8e9, 50, dtype=np.longdouble)
+    f = get_rednoise_freqs(t, 10)
+    F1 = component.fourier_design_matrix(t, f)
+    assert np.array_equal(F1, create_fourier_design_matrix(t, f))
+
+    # The cached basis must not be modified through a returned copy
+    F1[0, 0] = 42.0
+    F2 = component.fourier_design_matrix(t, f)
+    assert np.array_equal(F2, create_fourier_design_matrix(t, f))
+
+    F3 = component.fourier_design_matrix(t[1:], f[:5])
+    assert np.array_equal(F3, create_fourier_design_matrix(t[1:], f[:5]))